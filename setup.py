@@ -82,6 +82,15 @@ setup(
         'requests>=2.28.1'
         ],
     extras_require={
+            'fast': [
+                'orjson>=3'
+            ],
+            'lxml': [
+                'lxml>=4.9'
+            ],
+            'cache': [
+                'requests-cache>=0.9'
+            ],
             'tests': [
                 'types-requests>=2.28.1',
                 'types-beautifulsoup4>=4.10',
@@ -49,13 +49,37 @@ discover/merge these concurrently.
 
 __version__ = '0.9.9'
 
-from typing import List
-import warnings
-from .signpost import Signposting, Signpost, AbsoluteURI, MediaType, LinkRel
-from .linkheader import find_signposting_http_link
-from .resolver import find_signposting_http
-from .htmllinks import find_signposting_html
-from .linkset import find_signposting_linkset
-
-__all__ = """find_signposting_http_link find_signposting_http find_signposting_html find_signposting_linkset
+import importlib
+
+__all__ = """find_signposting_http_link find_signposting_http find_signposting_http_many
+find_signposting_from_headers find_signposting_html find_signposting_linkset
 Signposting Signpost AbsoluteURI MediaType LinkRel""".split()
+
+# PEP 562 lazy loading of the discovery backends, so that e.g.
+# ``import signposting`` for HTTP Link header parsing does not also
+# pay for loading the HTML and linkset dependencies like bs4.
+_LAZY = {
+    "find_signposting_http_link": "linkheader",
+    "find_signposting_http": "resolver",
+    "find_signposting_http_many": "resolver",
+    "find_signposting_from_headers": "resolver",
+    "find_signposting_html": "htmllinks",
+    "find_signposting_linkset": "linkset",
+    "Signposting": "signpost",
+    "Signpost": "signpost",
+    "AbsoluteURI": "signpost",
+    "MediaType": "signpost",
+    "LinkRel": "signpost",
+}
+
+def __getattr__(name):
+    """Import the module of a lazily loaded attribute on first access"""
+    if name not in _LAZY:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    module = importlib.import_module("." + _LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache for later attribute access
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -21,49 +21,71 @@ USAGE:
     signposting
 """
 
-from functools import reduce
+# PEP-563 -- so requests.Session annotations below do not need the
+# (deferred) import of requests at module load
+from __future__ import annotations
+
 # FIXME: Where can we import this from?
 ##from html.parser import HTMLParseError
-from typing import Collection, List, Tuple
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 import argparse
 import sys
-import enum
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import HTTPError, URLError
-from signposting.htmllinks import UnrecognizedContentType, find_signposting_html
-from signposting.linkset import LinksetParseError, find_signposting_linkset
 
+# NOTE: signposting.htmllinks and signposting.linkset (which pull in
+# bs4) are imported lazily below, so that header-only invocations do
+# not pay their import cost at startup.
 from signposting.signpost import Signposting
 
 from . import find_signposting_http, Signpost
 
-def _multiline(header: str, lines: Collection[str]):
+if TYPE_CHECKING:
+    import requests
+
+_INDENTS = {h: "\n" + " " * (len(h) + 2)
+            for h in ("Type", "Author", "Describes", "DescribedBy", "Item", "Linkset")}
+"""Precomputed indents for the fixed headers used by :meth:`print_signposting`"""
+
+def _multiline(header: str, lines: Iterable[str]):
     """Format header, with subsequent lines indented correspondingly"""
-    indent = "\n" + (" " * (len(header) + 2))
-    return "%s: %s" % (header, indent.join(lines))
+    indent = _INDENTS.get(header)
+    if indent is None: # e.g. an extension relation header
+        indent = "\n" + (" " * (len(header) + 2))
+    return f"{header}: {indent.join(lines)}"
 
 
 def _target(s: Signpost):
     """Format just target"""
-    return "<%s>" % s.target
+    return f"<{s.target}>"
 
 
 def _target_and_type(s: Signpost):
     """Format target and type"""
-    return "<%s> %s" % (s.target,
-                        s.type or "")
+    return f"<{s.target}> {s.type or ''}"
 
-ERROR = enum.IntEnum("Error",
-                      "OK URL_ERROR HTTP_ERROR LINK_SYNTAX INTERNAL_ERROR HTML_PARSE_ERROR UNRECOGNIZED_CONTENT_METHOD",
-                      start=0
-                      )
-"""Error codes returned by CLI"""
+class ERROR:
+    """Error codes returned by CLI"""
+    OK = 0
+    URL_ERROR = 1
+    HTTP_ERROR = 2
+    # NOTE: Only Link headers that may contain signposting relations
+    # are syntax-checked; other malformed headers are ignored
+    LINK_SYNTAX = 3
+    INTERNAL_ERROR = 4
+    HTML_PARSE_ERROR = 5
+    UNRECOGNIZED_CONTENT_METHOD = 6
 
-METHOD = enum.Enum("METHOD", "http html linkset merged")
-"""Discovery methods for signposting"""
 
-def main(*args: str):
-    """Discover signposting and print to STDOUT"""
+class METHOD:
+    """Discovery methods for signposting"""
+    http = "http"
+    html = "html"
+    linkset = "linkset"
+    merged = "merged"
 
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser()
     parser.add_argument("url", nargs='+',
                         help="URL(s) to discover signposting for")
@@ -89,6 +111,8 @@ def main(*args: str):
         action='store_true'),
     parser.add_argument("-e", "--extensions", help="Also report extension relation types",
         action='store_true'),
+    parser.add_argument("-w", "--workers", help="Maximum number of URLs to discover concurrently (default: 8)",
+        type=int, default=8),
 
 ## FIXME: Implement --contexts
     parser.add_argument("-c", "--any-context", dest="any_context", help="Include signposts any contexts/anchors, not just resolved URI", 
@@ -96,132 +120,184 @@ def main(*args: str):
 ## FIXME: Implement --format
 #    parser.add_argument("-f", "--format", help="Output format, plain text, HTTP link headers or RFC9264 JSON.", 
 #        choices="text link json".split(), default="text")
+    return parser
+
+_PARSER = _build_parser()
+"""Reusable argument parser, built once at import time"""
+
+def _cli_session() -> requests.Session:
+    """Session for one CLI invocation.
+
+    If the optional `requests_cache <https://pypi.org/project/requests-cache/>`_
+    package is installed (extra ``signposting[cache]``), repeated requests
+    within the invocation (e.g. --http and --html for the same URL, or
+    duplicate URLs on the command line) are served from an in-memory cache.
+    """
+    from signposting.sessions import new_session
+    try:
+        from requests_cache import CachedSession
+    except ImportError:
+        return new_session()
+    return new_session(CachedSession(backend="memory", expire_after=None))
+
+def main(*args: str):
+    """Discover signposting and print to STDOUT"""
+
+    parsed = _PARSER.parse_args(args or None)
 
-    if args:
-        parsed = parser.parse_args(args)
-    else:
-        parsed = parser.parse_args()
-    
     if not parsed.http and not parsed.html and not parsed.linkset:
         # No method specified, only HTTP/HTML by default
         parsed.http = True
         parsed.html = True
     
-    isFirst = True
-    signpostings: List[Tuple[METHOD,Signposting]] = []
-    for url in parsed.url:
-        if isFirst:
-            isFirst = False
-        else:
-            print()  # separator
-
-        if parsed.http:
-            only_http = not parsed.html and not parsed.linkset
-            try:
-                signposting = find_signposting_http(url, warn_empty=only_http)
-                signpostings.append((METHOD.http, signposting))
-            except HTTPError as e:
-                print("HTTP error for %s" % url, file=sys.stderr)
-                print("%s" % e.reason, file=sys.stderr)
-                return ERROR.HTTP_ERROR
-            except URLError as e:
-                print("Failed URL %s" % url, file=sys.stderr)
-                print("%s" % e.reason, file=sys.stderr)
-                return ERROR.URL_ERROR
-            except ValueError as e:
-                print("Could not parse Link header for %s" % url, file=sys.stderr)
-                print("%s" % e, file=sys.stderr)
-                return ERROR.LINK_SYNTAX
-
-        if parsed.html:
-            only_html = not parsed.http and not parsed.linkset
-            try:
-                signposting = find_signposting_html(url, warn_empty=only_html)
-                signpostings.append((METHOD.html, signposting))
-            except HTTPError as e:
-                print("HTTP error for %s" % url, file=sys.stderr)
-                print("%s" % e.reason, file=sys.stderr)
-                return ERROR.HTTP_ERROR
-            except IOError as e:
-                print("Network error for %s" % url, file=sys.stderr)
-                print("%s" % e, file=sys.stderr)
-                return ERROR.HTTP_ERROR
-            except ValueError as e:
-                print("Failed URL %s" % url, file=sys.stderr)
-                print("%s" % e, file=sys.stderr)
-                return ERROR.URL_ERROR
-#            except HTMLParseError as e:
-#                print("Could not parse HTML for %s" % url, file=sys.stderr)
-#                print("%s" % e, file=sys.stderr)
-#                return ERROR.HTML_PARSE_ERROR
-            except UnrecognizedContentType as e:
-                if not parsed.http and not parsed.linkset:
-                    # Silently ignore if other methods work
-                    print("%s" % e, file=sys.stderr)
-                    return ERROR.UNRECOGNIZED_CONTENT_METHOD
-        
-        if parsed.linkset:
-            try:
-                signposting = find_signposting_linkset(url)
-                signpostings.append((METHOD.linkset, signposting))
-            except HTTPError as e:
-                print("HTTP error for %s" % url, file=sys.stderr)
-                print("%s" % e.reason, file=sys.stderr)
-                return ERROR.HTTP_ERROR
-            except URLError as e:
-                print("Failed URL %s" % url, file=sys.stderr)
-                print("%s" % e.reason, file=sys.stderr)
-                return ERROR.URL_ERROR
-            except IOError as e:
-                print("Network error for %s" % url, file=sys.stderr)
-                print("%s" % e, file=sys.stderr)
-                return ERROR.HTTP_ERROR
-            except LinksetParseError as e:
-                print("Could not parse linkset for %s" % url, file=sys.stderr)
-                print("%s" % e, file=sys.stderr)
-                return ERROR.HTML_PARSE_ERROR
-            except UnrecognizedContentType as e:
-                print("%s" % e, file=sys.stderr)
-                return ERROR.UNRECOGNIZED_CONTENT_METHOD
-
-        if not parsed.distinct:
-            signpostings = [(METHOD.merged, 
-                            reduce(lambda a,b: a|b, 
-                                   (s for _,s in signpostings), 
-                                   Signposting()))]
-        for (method,signposting) in signpostings:
-            print("Signposting for", signposting.context or url, 
-                    " (%s)" % method.name if method != method.merged else "")
-            if parsed.any_context or (parsed.linkset and not parsed.html and not parsed.http):
-                signposting = signposting.for_context(None)
-            print_signposting(signposting, parsed.extensions)
+    # All discovery methods (including --http since the resolver moved
+    # onto pooled requests sessions) share one session, so repeated
+    # requests benefit from connection reuse and, if requests-cache is
+    # installed, its in-memory cache
+    with _cli_session() as session:
+        # Network-bound discovery runs concurrently across URLs; results
+        # are printed afterwards in the original argument order.
+        with ThreadPoolExecutor(max_workers=max(1, min(parsed.workers, len(parsed.url)))) as executor:
+            results = list(executor.map(
+                lambda url: _discover(url, parsed, session), parsed.url))
+
+        isFirst = True
+        for url, signpostings, error, messages in results:
+            buf: List[str] = []
+            if isFirst:
+                isFirst = False
+            else:
+                buf.append("")  # separator
+            for message in messages:
+                print(message, file=sys.stderr)
+            if error is not None:
+                return error
+
+            if not parsed.distinct:
+                signpostings = [(METHOD.merged,
+                                Signposting.merge(s for _,s in signpostings))]
+            for (method,signposting) in signpostings:
+                from_method = f" ({method})" if method != METHOD.merged else ""
+                buf.append(f"Signposting for {signposting.context or url} {from_method}")
+                if parsed.any_context or (parsed.linkset and not parsed.html and not parsed.http):
+                    signposting = signposting.for_context(None)
+                print_signposting(signposting, parsed.extensions, out=buf)
+            # Single write per URL amortizes the stdout lock/flushes
+            sys.stdout.write("\n".join(buf) + "\n")
     return ERROR.OK
 
-def print_signposting(signposting: Signposting, extensions=False):
-    if (signposting.citeAs):
-        print("CiteAs:", _target(signposting.citeAs))
-    if (signposting.types):
-        print(_multiline("Type", [_target(l) for l in signposting.types]))
-    if (signposting.collection):
-        print("Collection:", _target(signposting.collection))
-    if (signposting.license):
-        print("License:", _target(signposting.license))
-    if (signposting.authors):
-        print(_multiline("Author", [_target(l)
-            for l in signposting.authors]))
-    if (signposting.describes):
-        print(_multiline("Describes", [
-            _target_and_type(l) for l in signposting.describes]))
-    if (signposting.describedBy):
-        print(_multiline("DescribedBy", [
-            _target_and_type(l) for l in signposting.describedBy]))
-    if (signposting.items):
-        print(_multiline("Item", [_target_and_type(l)
-            for l in signposting.items]))
-    if (signposting.linksets):
-        print(_multiline("Linkset", [_target_and_type(l)
-            for l in signposting.linksets]))
+def _discover(url: str, parsed: argparse.Namespace, session: requests.Session
+              ) -> Tuple[str, List[Tuple[str, Signposting]], Optional[int], List[str]]:
+    """Discover signposting for a single URL with the selected methods.
+
+    This helper is safe to run from multiple threads; any error
+    reporting is returned rather than printed.
+
+    :return: Tuple of the ``url``, its discovered ``(METHOD, Signposting)``
+        pairs, an `ERROR` code (or `None` on success) and
+        any error messages destined for stderr.
+    """
+    signpostings: List[Tuple[str,Signposting]] = []
+
+    if parsed.http:
+        only_http = not parsed.html and not parsed.linkset
+        try:
+            signposting = find_signposting_http(url, warn_empty=only_http,
+                                                session=session)
+            signpostings.append((METHOD.http, signposting))
+        except HTTPError as e:
+            return url, signpostings, ERROR.HTTP_ERROR, [
+                f"HTTP error for {url}", f"{e.reason}"]
+        except URLError as e:
+            return url, signpostings, ERROR.URL_ERROR, [
+                f"Failed URL {url}", f"{e.reason}"]
+        except ValueError as e:
+            return url, signpostings, ERROR.LINK_SYNTAX, [
+                f"Could not parse Link header for {url}", f"{e}"]
+
+    if parsed.html:
+        from signposting.htmllinks import UnrecognizedContentType, find_signposting_html
+        only_html = not parsed.http and not parsed.linkset
+        try:
+            signposting = find_signposting_html(url, warn_empty=only_html, session=session)
+            signpostings.append((METHOD.html, signposting))
+        except HTTPError as e:
+            return url, signpostings, ERROR.HTTP_ERROR, [
+                f"HTTP error for {url}", f"{e.reason}"]
+        except IOError as e:
+            return url, signpostings, ERROR.HTTP_ERROR, [
+                f"Network error for {url}", f"{e}"]
+        except ValueError as e:
+            return url, signpostings, ERROR.URL_ERROR, [
+                f"Failed URL {url}", f"{e}"]
+#        except HTMLParseError as e:
+#            return url, signpostings, ERROR.HTML_PARSE_ERROR, [
+#                f"Could not parse HTML for {url}", f"{e}"]
+        except UnrecognizedContentType as e:
+            if not parsed.http and not parsed.linkset:
+                # Silently ignore if other methods work
+                return url, signpostings, ERROR.UNRECOGNIZED_CONTENT_METHOD, [f"{e}"]
+
+    if parsed.linkset:
+        from signposting.htmllinks import UnrecognizedContentType
+        from signposting.linkset import LinksetParseError, find_signposting_linkset
+        try:
+            signposting = find_signposting_linkset(url, session=session)
+            signpostings.append((METHOD.linkset, signposting))
+        except HTTPError as e:
+            return url, signpostings, ERROR.HTTP_ERROR, [
+                f"HTTP error for {url}", f"{e.reason}"]
+        except URLError as e:
+            return url, signpostings, ERROR.URL_ERROR, [
+                f"Failed URL {url}", f"{e.reason}"]
+        except IOError as e:
+            return url, signpostings, ERROR.HTTP_ERROR, [
+                f"Network error for {url}", f"{e}"]
+        except LinksetParseError as e:
+            return url, signpostings, ERROR.HTML_PARSE_ERROR, [
+                f"Could not parse linkset for {url}", f"{e}"]
+        except UnrecognizedContentType as e:
+            return url, signpostings, ERROR.UNRECOGNIZED_CONTENT_METHOD, [f"{e}"]
+
+    return url, signpostings, None, []
+
+def print_signposting(signposting: Signposting, extensions=False, out: Optional[List[str]] = None):
+    """Report discovered signposting as text.
+
+    Lines are appended to the ``out`` buffer if provided, otherwise
+    written to stdout in a single call.
+    """
+    lines = [] if out is None else out
+    # Snapshot attributes once instead of repeated lookups below
+    citeAs = signposting.citeAs
+    types = signposting.types
+    collection = signposting.collection
+    license = signposting.license
+    authors = signposting.authors
+    describes = signposting.describes
+    describedBy = signposting.describedBy
+    items = signposting.items
+    linksets = signposting.linksets
+    if (citeAs):
+        lines.append(f"CiteAs: {_target(citeAs)}")
+    if (types):
+        lines.append(_multiline("Type", map(_target, types)))
+    if (collection):
+        lines.append(f"Collection: {_target(collection)}")
+    if (license):
+        lines.append(f"License: {_target(license)}")
+    if (authors):
+        lines.append(_multiline("Author", map(_target, authors)))
+    if (describes):
+        lines.append(_multiline("Describes", map(_target_and_type, describes)))
+    if (describedBy):
+        lines.append(_multiline("DescribedBy", map(_target_and_type, describedBy)))
+    if (items):
+        lines.append(_multiline("Item", map(_target_and_type, items)))
+    if (linksets):
+        lines.append(_multiline("Linkset", map(_target_and_type, linksets)))
     if (extensions):
         for k in signposting._extensions:
-            print(_multiline("<%s>" % k, [_target_and_type(l)
-                for l in signposting._extensions[k]]))
+            lines.append(_multiline(f"<{k}>", map(_target_and_type, signposting._extensions[k])))
+    if out is None and lines:
+        sys.stdout.write("\n".join(lines) + "\n")
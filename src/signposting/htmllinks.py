@@ -18,22 +18,43 @@
 Parse HTML to find <link> elements for signposting.
 """
 
-from typing import Union
+from typing import Dict, List, Optional, Union
+import re
 import warnings
+from html import unescape
 import requests
 from bs4 import BeautifulSoup,SoupStrainer
 # FIXME: Where can we import this from?
 ##from html.parser import HTMLParseError
 from .signpost import SIGNPOSTING,AbsoluteURI,Signpost,Signposting
+# NOTE: Re-exported here for backwards compatibility; the session
+# helpers live in their own module so that header-only discovery
+# (resolver) can use them without importing bs4
+from .sessions import TIMEOUT, default_session, new_session, set_session
 
-def find_signposting_html(uri:Union[AbsoluteURI, str], warn_empty:bool=True) -> Signposting:
+try:
+    # lxml parses ~10x faster than the pure-Python html.parser
+    import lxml  # type: ignore[import-untyped]  # noqa: F401
+    _SOUP_PARSER = "lxml"
+except ImportError:
+    _SOUP_PARSER = "html.parser"
+
+_REL_CANON = {v: v for v in SIGNPOSTING}
+"""Identity map of canonical rel tokens.
+
+Well-behaved pages use the lower-case spellings, so a dict hit here
+skips the ``str.lower()`` allocation per rel token in the link loops."""
+
+def find_signposting_html(uri:Union[AbsoluteURI, str], warn_empty:bool=True,
+                          session:Optional[requests.Session]=None) -> Signposting:
     """Parse HTML to find ``<link>`` elements for signposting.
-    
+
     HTTP redirects will be followed and any relative paths in links
     made absolute correspondingly.
 
     :param uri: An absolute http/https URI, which HTML will be inspected.
     :param warn_empty: If true, raise warning if no direct signpostings were found
+    :param session: Optional :class:`requests.Session` to reuse connections from
     :throws ValueError: If the `uri` is invalid
     :throws IOError: If the network request failed, e.g. connection timeout
     :throws requests.HTTPError: If the HTTP request failed, e.g. 404 Not Found
@@ -41,7 +62,7 @@ def find_signposting_html(uri:Union[AbsoluteURI, str], warn_empty:bool=True) ->
     :throws HTMLParseError: If the HTML could not be parsed.
     :returns: A parsed :class:`Signposting` object (which may be empty)
     """
-    html = _get_html(AbsoluteURI(uri))
+    html = _get_html(AbsoluteURI(uri), session)
     signposting = _parse_html(html)
     if warn_empty and not signposting:
         warnings.warn("No direct signposting found in HTML from <%s>" % html.requested_url)
@@ -59,16 +80,25 @@ class DownloadedText(str):
     resolved_url: AbsoluteURI
     """The resolved URL, after redirection."""
 
-    def __new__(cls, value:str, content_type:str, requested_url:AbsoluteURI, resolved_url:AbsoluteURI):
+    raw: Optional[bytes]
+    """The undecoded bytes as downloaded, if available.
+
+    Parsers that do their own charset detection (e.g. lxml) can consume
+    these directly, skipping a redundant decode/encode round-trip.
+    """
+
+    def __new__(cls, value:str, content_type:str, requested_url:AbsoluteURI, resolved_url:AbsoluteURI,
+                raw:Optional[bytes]=None):
         # NOTE: Do not return value if it's already an DownloadedText
         # instance; it may differ in the other attributes or subclass
         s = super().__new__(cls, value)
-        # NOTE: content_type is necessarily a signpost.MediaType, 
-        # as this string typically include charset, e.g. 
+        # NOTE: content_type is necessarily a signpost.MediaType,
+        # as this string typically include charset, e.g.
         # "text/html; charset=iso-8859-1"
         s.content_type = content_type
         s.requested_url = requested_url
         s.resolved_url = resolved_url
+        s.raw = raw
         return s
 
 class HTML(DownloadedText):
@@ -85,12 +115,40 @@ class UnrecognizedContentType(Exception):
         self.content_type = content_type
         self.uri = uri
 
-def _get_html(uri:AbsoluteURI) -> Union[HTML,XHTML]:
+_MAX_HTML_BYTES = 1024 * 1024
+"""Upper bound of HTML bytes downloaded if no </head> is found"""
+
+_HEAD_END = b"</head>"
+
+def _download_head(page: requests.Response) -> bytes:
+    """Download the HTML response body, stopping early after ``</head>``.
+
+    Signposting ``<link>`` elements only occur within ``<head>``, so for
+    large landing pages the remaining body bytes need not be transferred.
+    Download is capped at :const:`_MAX_HTML_BYTES` if no ``</head>`` is
+    found, e.g. in malformed HTML.
+    """
+    buf = bytearray()
+    for chunk in page.iter_content(8192):
+        buf += chunk
+        # Rewind a tag-length overlap in case </head> straddled two chunks
+        search_from = max(0, len(buf) - len(chunk) - len(_HEAD_END))
+        found = bytes(buf[search_from:]).lower().find(_HEAD_END)
+        if found >= 0:
+            del buf[search_from + found + len(_HEAD_END):]
+            break
+        if len(buf) >= _MAX_HTML_BYTES:
+            break
+    page.close()
+    return bytes(buf)
+
+def _get_html(uri:AbsoluteURI, session:Optional[requests.Session]=None) -> Union[HTML,XHTML]:
     HEADERS = {
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9"
     }
     # Should ideally throw Not Acceptable error if none of the above
-    page = requests.get(uri, headers=HEADERS)
+    page = (session or default_session()).get(uri, headers=HEADERS,
+                                              stream=True, timeout=TIMEOUT)
 
     resolved_url = AbsoluteURI(page.url, uri)
     
@@ -114,41 +172,163 @@ def _get_html(uri:AbsoluteURI) -> Union[HTML,XHTML]:
     
     ct = page.headers.get("Content-Type", "")
     if "text/html" in ct:
-        # page.text should get HTTP-level encoding correct,
-        # but will not know about any charset declarations inside.
-        return HTML(page.text, ct, uri, resolved_url)
+        raw = _download_head(page)
+        # The HTTP-level charset should be correct here, but will not
+        # know about any charset declarations inside; those are left to
+        # the parser, which gets the undecoded bytes via `raw`.
+        text = str(raw, page.encoding or "utf-8", errors="replace")
+        return HTML(text, ct, uri, resolved_url, raw)
     elif "application/xhtml+xml" in ct or "application/xml" in ct or "xhtml" in ct or "+xml" in ct:
         # Hopefully some XHTML inside.
-        # These typically don't have charset parameter, the below
-        # will guess by detection
-        return XHTML(page.text, ct, uri, resolved_url)
+        # These typically don't have charset parameter, in which
+        # case UTF-8 is assumed below
+        raw = _download_head(page)
+        text = str(raw, page.encoding or "utf-8", errors="replace")
+        return XHTML(text, ct, uri, resolved_url, raw)
     else:
         # HTTP server didn't honor our Accept header, and returned non-HTML.
         # It may be an image or something else that will crash our HTML parser,
-        # so we'll bail out here.
+        # so we'll bail out here without downloading the body.
+        page.close()
         raise UnrecognizedContentType(ct, uri)
 
+_STRAINER = SoupStrainer(["head", "link"])
+"""Restrict BeautifulSoup parsing to the elements relevant for signposting"""
+
+_HEAD_RE = re.compile(r"<head\b[^>]*>(.*?)</head>", re.IGNORECASE|re.DOTALL)
+"""Find the <head> element, where signposting <link> elements live"""
+
+_LINK_RE = re.compile(r"<link\b([^>]*)>", re.IGNORECASE)
+"""Find a <link> element and capture its attribute string"""
+
+_ATTR_RE = re.compile(r"""(\w+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+"""Find a single attribute, quoted by ", ' or unquoted"""
+
+_IGNORED_SPANS_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b.*?</\1\s*>", re.IGNORECASE|re.DOTALL)
+"""Comments and script/style elements, where <link> markup is not a link"""
+
+_UNPARSABLE_RE = re.compile(r"<!--|<script\b|<style\b", re.IGNORECASE)
+"""Remains of an unterminated comment or script/style element"""
+
 def _parse_html(html:Union[HTML,XHTML]) -> Signposting:
-    soup = BeautifulSoup(html, 'html.parser', 
+    signposting = _parse_html_fast(html)
+    if signposting is None:
+        # Fast path gave up, build a proper DOM instead
+        signposting = _parse_html_soup(html)
+    return signposting
+
+def _parse_html_fast(html:Union[HTML,XHTML]) -> Optional[Signposting]:
+    """Find signposting from <link> elements with precompiled regexes.
+
+    For the common case of well-formed HTML this avoids building a
+    BeautifulSoup DOM of the whole document, scanning only the
+    ``<head>`` section instead.
+
+    :returns: A parsed :class:`Signposting`, or ``None`` if this fast
+        path could not find any signposting links, in which case the
+        caller should fall back to :meth:`_parse_html_soup`.
+    """
+    head = _HEAD_RE.search(html)
+    if not head:
+        return None # Missing or unconventional <head>, let bs4 decide
+    # A <link> inside a comment or e.g. a script's document.write()
+    # string is markup, not a link -- cut those spans before scanning
+    head_html = _IGNORED_SPANS_RE.sub("", head.group(1))
+    if _UNPARSABLE_RE.search(head_html):
+        # Unterminated comment/script, too murky for regexes
+        return None
+    signposts = []
+    missing_href: List[str] = []
+    invalid: List[str] = []
+    # Local alias; already a validated AbsoluteURI, so Signpost() below
+    # will not re-parse it per link
+    resolved_url = html.resolved_url
+    for link in _LINK_RE.finditer(head_html):
+        attrs: Dict[str, str] = {}
+        for match in _ATTR_RE.finditer(link.group(1)):
+            key = match.group(1).lower()
+            # Only one of the quoted/unquoted value groups matched
+            value = match.group(2) or match.group(3) or match.group(4) or ""
+            attrs.setdefault(key, unescape(value))
+        url = attrs.get("href")
+        if not url:
+            missing_href.append(link.group())
+            continue
+        rels = set()
+        for r in attrs.get("rel", "").split():
+            rl = _REL_CANON.get(r)
+            if rl is None:
+                rl = r.lower() # lower-case only once per token
+                if rl not in SIGNPOSTING and ":" not in rl:
+                    continue
+            rels.add(rl)
+        for rel in rels:
+            try:
+                signpost = Signpost(rel, url, attrs.get("type"), attrs.get("profile"), resolved_url)
+            except ValueError as e:
+                invalid.append(str(e))
+                continue
+            signposts.append(signpost)
+    if not signposts:
+        return None # Possibly malformed HTML hiding the links, let bs4 retry
+    _warn_ignored(html, missing_href, invalid)
+    return Signposting(resolved_url, signposts)
+
+def _warn_ignored(html:Union[HTML,XHTML], missing_href:List[str], invalid:List[str]):
+    """Warn once per category about ignored ``<link>`` elements.
+
+    ``warnings.warn`` walks the stack and the warning filters on every
+    call, so pages with many broken links are summarized into a single
+    warning per category rather than one per link.
+    """
+    if missing_href:
+        warnings.warn("Ignored %i <link> element(s), missing href attribute: %s" %
+                      (len(missing_href), "; ".join(missing_href[:3])))
+    if invalid:
+        warnings.warn("Ignored %i invalid signpost(s) from %s: %s" %
+                      (len(invalid), html.requested_url, "; ".join(invalid[:3])))
+
+def _parse_html_soup(html:Union[HTML,XHTML]) -> Signposting:
+    parser = _SOUP_PARSER
+    if isinstance(html, XHTML) and _SOUP_PARSER == "lxml":
+        parser = "lxml-xml" # C-implemented XML parse, no tag-soup fixups
+    # Prefer the undecoded bytes so the parser can do its own charset
+    # detection (e.g. <meta charset>), avoiding a re-encoding round-trip
+    markup: Union[str, bytes] = html.raw if html.raw is not None else html
+    soup = BeautifulSoup(markup, parser,
         # Ignore any other elements to reduce chance of parse errors
-        parse_only=SoupStrainer(["head", "link"]))
+        parse_only=_STRAINER)
+    if parser == "lxml-xml" and soup.head is None:
+        # Not well-formed XHTML after all; retry with the lenient HTML parser
+        soup = BeautifulSoup(markup, _SOUP_PARSER, parse_only=_STRAINER)
     signposts = []
+    missing_href: List[str] = []
+    invalid: List[str] = []
+    resolved_url = html.resolved_url # local alias, hot loop below
     if soup.head: # In case <head> was missing
         for link in soup.head.find_all("link"):
             # Ensure all filters are in lower case and known
             url = link.get("href")
             if not url:
-                warnings.warn("Invalid <link> element, missing href attribute: %s" % link)
+                missing_href.append(str(link))
                 continue
             type = link.get("type")
             profiles = link.get("profile")
-            rels = set(r.lower() for r in link.get("rel", [])
-                        if r.lower() in SIGNPOSTING or ":" in r)
+            rels = set()
+            for r in link.get("rel") or ():
+                rl = _REL_CANON.get(r)
+                if rl is None:
+                    rl = r.lower() # lower-case only once per token
+                    if rl not in SIGNPOSTING and ":" not in rl:
+                        continue
+                rels.add(rl)
             for rel in rels:
                 try:
-                    signpost = Signpost(rel, url, type, profiles, html.resolved_url)
+                    signpost = Signpost(rel, url, type, profiles, resolved_url)
                 except ValueError as e:
-                    warnings.warn("Ignoring invalid signpost from %s: %s" % (html.requested_url, e))
+                    invalid.append(str(e))
                     continue
                 signposts.append(signpost)
-    return Signposting(html.resolved_url, signposts)
+    _warn_ignored(html, missing_href, invalid)
+    return Signposting(resolved_url, signposts)
@@ -18,12 +18,143 @@
 Parse HTTP headers to find Signposting links
 """
 
-from typing import List, Tuple, Optional, Union
+from typing import FrozenSet, List, Tuple, Optional, Union
+import functools
+import re
+import sys
 from httplink import ParsedLinks, Link, parse_link_header
 from urllib.parse import urljoin
 from .signpost import SIGNPOSTING, Signpost, Signposting, LinkRel, AbsoluteURI
 
 
+_LINK_VALUE_RE = re.compile(r'''\s*<([^>]*)>\s*
+    ((?:;\s*[\w!#$%&'+.^`|~*-]+\s*=\s*(?:"(?:[^"\\]|\\.)*"|[\w!#$%&'+.^`|~*-]*)\s*)*)''',
+    re.VERBOSE)
+"""A single RFC8288 link-value: ``<URI>`` followed by its parameters"""
+
+_PARAM_RE = re.compile(r''';\s*([\w!#$%&'+.^`|~*-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([\w!#$%&'+.^`|~*-]*))''')
+"""One ``; key=value`` link parameter, with quoted or unquoted value.
+
+Unquoted values are restricted to RFC7230 token characters; values
+needing quoting (e.g. an unquoted URI) fall through to httplink."""
+
+_QUOTED_PAIR_RE = re.compile(r"\\(.)")
+"""A backslash-escaped character inside a quoted string"""
+
+_EXT_REL_RE = re.compile(r"""rel\s*=\s*(?:"[^"]*:|'[^']*:|[^,;"'\s]*:)""")
+"""A rel attribute whose value may contain an extension URI relation"""
+
+def _may_contain_signposting(header: str) -> bool:
+    """Cheap pre-filter: can this Link header contain signposting at all?
+
+    Headers carrying only relations like ``stylesheet`` or ``preload``
+    are common; a C-level substring scan for the signposting rel names
+    (or a possible extension URI rel) is far cheaper than tokenizing the
+    header. False positives merely proceed to the full parse.
+    """
+    lowered = header.lower() # rel names are case-insensitive
+    for r in SIGNPOSTING:
+        if r in lowered:
+            return True
+    return _EXT_REL_RE.search(lowered) is not None
+
+_urljoin_cached = functools.lru_cache(maxsize=4096)(urljoin)
+"""Memoized :meth:`urllib.parse.urljoin` for repeated relative references"""
+
+def _urljoin(base: str, url: str) -> str:
+    """Resolve ``url`` against ``base``, shortcutting absolute http(s) URLs.
+
+    Most signposting link targets are already absolute, in which case
+    the two ``urlsplit`` calls inside ``urljoin`` can be skipped
+    entirely; the remaining relative references (often the same anchor
+    repeated within one linkset) are resolved through a cache.
+    """
+    if url.startswith(("http://", "https://")):
+        return url
+    return _urljoin_cached(base, url)
+
+
+def _fast_parse(header: str) -> Optional[ParsedLinks]:
+    """Parse a combined ``Link`` header with precompiled regexes.
+
+    This is a single-pass tokenizer for the common shape of RFC8288
+    headers, avoiding the backtracking parser of :mod:`httplink` on the
+    hot path.
+
+    :param header: The combined ``Link`` header values, comma-separated
+    :return: The :class:`ParsedLinks`, or ``None`` if the header did not
+        parse cleanly, in which case the caller should fall back to
+        :meth:`httplink.parse_link_header` for exact error semantics.
+    """
+    links: List[Link] = []
+    pos = 0
+    end = len(header)
+    while pos < end:
+        if header[pos] in ", \t":
+            pos += 1 # Skip separators between link-values
+            continue
+        match = _LINK_VALUE_RE.match(header, pos)
+        if not match:
+            return None # Unrecognized syntax, let httplink decide
+        attributes = []
+        for param in _PARAM_RE.finditer(match.group(2)):
+            key = sys.intern(param.group(1))
+            if param.group(2) is not None:
+                value = _QUOTED_PAIR_RE.sub(r"\1", param.group(2))
+            else:
+                value = param.group(3) or ""
+            if key == "rel":
+                # Intern for fast SIGNPOSTING membership tests downstream
+                value = sys.intern(value)
+            attributes.append((key, value))
+        try:
+            links.append(Link(match.group(1), attributes))
+        except ValueError:
+            return None # e.g. missing rel; report through httplink instead
+        pos = match.end()
+    if not links:
+        return None
+    return ParsedLinks(links)
+
+
+def _parse_header(header: str) -> ParsedLinks:
+    """Parse a combined ``Link`` header.
+
+    :raise ValueError: If the header could not be parsed.
+    """
+    parsed = _fast_parse(header)
+    if parsed is None:
+        parsed = parse_link_header(header)
+    return parsed
+
+
+_parse_cached = functools.lru_cache(maxsize=1024)(_parse_header)
+"""As :meth:`_parse_header`, memoizing recent results.
+
+Crawlers (and tests) frequently re-parse identical headers from
+revisited endpoints; a cache hit collapses the whole tokenizer cost
+to a dict lookup. Safe to share as callers never mutate the
+returned :class:`ParsedLinks` in place. Parse errors are not cached."""
+
+_CACHE_HEADER_MAX = 8192
+"""Upper length of headers worth caching.
+
+Actual HTTP ``Link`` headers stay well below this, but whole RFC9264
+linkset text documents also come through here (see
+:meth:`linkset._parse_linkset`) and can be megabytes -- pinning up to
+1024 of those in the cache for the process lifetime would be a leak,
+not a cache."""
+
+def _parse(header: str) -> ParsedLinks:
+    """Parse a combined ``Link`` header, memoized unless oversized.
+
+    :raise ValueError: If the header could not be parsed.
+    """
+    if len(header) > _CACHE_HEADER_MAX:
+        return _parse_header(header)
+    return _parse_cached(header)
+
+
 def _filter_links_by_rel(parsedLinks: ParsedLinks, *rels: str) -> List[Link]:
     """Filter links to select from a set of relations.
 
@@ -35,15 +166,27 @@ def _filter_links_by_rel(parsedLinks: ParsedLinks, *rels: str) -> List[Link]:
 
     """
     if rels:
-        # Ensure all filters are in lower case
-        filterRels = set(r.lower() for r in rels)
-        unknown = filterRels - SIGNPOSTING
-        if unknown:
-            raise ValueError("Unknown FAIR Signposting relations: %s" % unknown)
+        filterRels: FrozenSet[str] = _validated_rels(rels)
     else:
         # Fallback - all valid signposting relations
         filterRels = SIGNPOSTING
-    return [l for l in parsedLinks.links if l.rel & filterRels]
+    # isdisjoint avoids allocating an intersection set per link
+    return [l for l in parsedLinks.links if not filterRels.isdisjoint(l.rel)]
+
+
+@functools.lru_cache(maxsize=64)
+def _validated_rels(rels: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lower-case and validate a tuple of relation filters.
+
+    Filter tuples come from a handful of fixed call sites, so the
+    (validated) frozensets are memoized; failed validations raise
+    ValueError uncached.
+    """
+    filterRels = frozenset(r.lower() for r in rels)
+    unknown = filterRels - SIGNPOSTING
+    if unknown:
+        raise ValueError("Unknown FAIR Signposting relations: %s" % unknown)
+    return filterRels
 
 
 def _filter_links_uris(parsedLinks: ParsedLinks) -> List[Link]:
@@ -66,6 +209,20 @@ def _filter_links_uris(parsedLinks: ParsedLinks) -> List[Link]:
                     
     return extensions
 
+def _is_extension_link(link: Link) -> bool:
+    """Check if a link has at least one extension URI relation.
+
+    Single-link variant of :meth:`_filter_links_uris`.
+    """
+    for rel in link.rel:
+        if ":" in rel:
+            try:
+                AbsoluteURI(rel)
+                return True
+            except ValueError:
+                continue
+    return False
+
 def _optional_link(parsedLinks: ParsedLinks, rel: str) -> Optional[Link]:
     """Look up a single link relation.
 
@@ -97,8 +254,29 @@ def _link_attr(link: Link, key: str) -> Optional[str]:
         return link[key]
     return None
 
-def linkToSignpost(link: Link, rel: Union[LinkRel,AbsoluteURI], context_url: str = None) -> Signpost:
-    """Convert from a :class:`Link` to a :class:`Signpost` 
+def _signpost_attrs(link: Link) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extract the ``anchor``, ``type`` and ``profile`` attributes in one sweep.
+
+    A single pass over :attr:`Link.attributes` replaces separate
+    ``in``/``[]`` lookups per attribute. First occurrence wins, matching
+    :meth:`Link.__getitem__`.
+    """
+    anchor = type = profile = None
+    for k, v in link.attributes:
+        k = k.lower()
+        if k == "anchor":
+            if anchor is None:
+                anchor = v
+        elif k == "type":
+            if type is None:
+                type = v
+        elif k == "profile":
+            if profile is None:
+                profile = v
+    return anchor, type, profile
+
+def linkToSignpost(link: Link, rel: Union[LinkRel,AbsoluteURI], context_url: Optional[str] = None) -> Signpost:
+    """Convert from a :class:`Link` to a :class:`Signpost`
     object for a given link relation.
 
     :param link: The :class:`Link` to convert
@@ -106,13 +284,17 @@ def linkToSignpost(link: Link, rel: Union[LinkRel,AbsoluteURI], context_url: str
     :param context_url: Optional, the context URL these link describe (unless specifying ``anchor``)
     :return: The converted :class:`Signpost` object
     """
-    context = _link_attr(link, "anchor") or context_url
-    return Signpost(rel, link.target,
-        _link_attr(link, "type"),
-        _link_attr(link, "profile"),
-        context, link)
+    anchor, type, profile = _signpost_attrs(link)
+    return Signpost(rel, link.target, type, profile,
+        anchor or context_url, link)
+
+_mk_rel = functools.lru_cache(maxsize=None)(LinkRel)
+"""Memoized LinkRel lookup; there are only 9 distinct values"""
 
-def linksToSignposting(links: List[Link], context: str = None) -> Signposting:
+_mk_ext_rel = functools.lru_cache(maxsize=256)(AbsoluteURI)
+"""Memoized extension relation URIs, revalidated once per distinct value"""
+
+def linksToSignposting(links: List[Link], context: Optional[str] = None) -> Signposting:
         """Initialize Signposting object for a given `ParsedLinks`
         as discovered from the (optional) `context` base URL.
 
@@ -125,11 +307,14 @@ def linksToSignposting(links: List[Link], context: str = None) -> Signposting:
             # TODO: Check if context matches "anchor"
             for rel in l.rel:
                 if rel in SIGNPOSTING: # Allow URI extensions https://datatracker.ietf.org/doc/html/rfc8288#section-2.1.2
-                    signposts.append(linkToSignpost(l, LinkRel(rel), context))
+                    signposts.append(linkToSignpost(l, _mk_rel(rel), context))
                 elif ":" in rel:
-                    signposts.append(linkToSignpost(l, AbsoluteURI(rel), context))
+                    signposts.append(linkToSignpost(l, _mk_ext_rel(rel), context))
         return Signposting(context, signposts)
 
+_RESOLVE_KEYS = frozenset(("anchor", "profile"))
+"""Link attributes whose values are URI references to be made absolute"""
+
 def _absolute_attribute(k: str, v: str, baseurl: str) -> Tuple[str, str]:
     """Ensure link attribute value uses absolute URI, resolving from the baseurl.
 
@@ -138,36 +323,55 @@ def _absolute_attribute(k: str, v: str, baseurl: str) -> Tuple[str, str]:
 
     .. _context: https://datatracker.ietf.org/doc/html/rfc8288#section-3.2
     """
-    if k.lower() == "anchor" or k.lower() == "profile":
-        return k, urljoin(baseurl, v)
+    # Attribute keys are virtually always lowercase on the wire;
+    # islower() avoids allocating a lowered copy in that case
+    kl = k if k.islower() else k.lower()
+    if kl in _RESOLVE_KEYS:
+        return k, _urljoin(baseurl, v)
     return k, v
 
 
-def find_signposting_http_link(headers: List[str], baseurl: str = None) -> Signposting:
+def find_signposting_http_link(headers: Union[str, List[str]], baseurl: Optional[str] = None) -> Signposting:
     """Find signposting among HTTP Link headers.
 
     Links are discovered according to defined `FAIR`_ `signposting`_ relations.
 
-    :param headers: A list of individual HTTP ``Link`` headers. 
-        The headers should be valid according to `RFC8288`_, 
+    :param headers: A list of individual HTTP ``Link`` headers, or a
+        single such header string (e.g. straight from
+        ``response.headers``, which combines repeats comma-separated
+        as `RFC8288`_ permits).
+        The headers should be valid according to `RFC8288`_,
         excluding the ``"Link:"`` prefix.
     :param baseurl: Optional base URL to make relative link targets absolute from
     :return: A :class:`Signposting` of the collected signposts.
-    :raise ValueError: If the link headers could not be parsed.
+    :raise ValueError: If link headers that may contain signposting
+        could not be parsed. Headers without any signposting-looking
+        relations are skipped without syntax checking.
 
     .. _signposting: https://signposting.org/conventions/
     .. _FAIR: https://signposting.org/FAIR/
     .. _rfc8288: https://doi.org/10.17487/RFC8288
 
     """
-    parsed = parse_link_header(", ".join(headers))
+    header_list = (headers,) if isinstance(headers, str) else headers
+    # Link header values are self-contained, so each can be parsed (and
+    # cached) on its own -- no ", "-joined intermediate string needed
+    links: List[Link] = []
+    for header in header_list:
+        if not _may_contain_signposting(header):
+            # NOTE: Deliberately skips syntax validation of headers that
+            # can't yield signposts anyway
+            continue
+        links.extend(_parse(header).links)
     signposting: List[Link] = []
-    # Ignore non-Signposting relations like "stylesheet"
-    # but include URI extensions
-    for l in (_filter_links_by_rel(parsed) + _filter_links_uris(parsed)):
+    # Single pass over the links: ignore non-Signposting relations like
+    # "stylesheet", but include URI extensions
+    for l in links:
+        if SIGNPOSTING.isdisjoint(l.rel) and not _is_extension_link(l):
+            continue
         if baseurl is not None:
             # Make URLs absolute by modifying Link object in-place
-            target = urljoin(baseurl, l.target)
+            target = _urljoin(baseurl, l.target)
             attributes = [_absolute_attribute(
                 k, v, baseurl) for k, v in l.attributes]
             link = Link(target, attributes)
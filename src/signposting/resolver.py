@@ -18,46 +18,254 @@
 Resolve a URI (possibly a PID) to find FAIR Signposting
 """
 
-import urllib.request
+import concurrent.futures
+import re
+import time
+import urllib.error
 import warnings
 
+import requests
+
 from . import linkheader
+from .sessions import TIMEOUT, default_session
 from .signpost import Signposting
 
-from typing import List
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+
+class _CacheEntry(NamedTuple):
+    """A cached Signposting with its HTTP validators and freshness"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float # monotonic deadline; 0.0 means always revalidate
+    signposting: Signposting
+
+
+_CACHE_SIZE = 128
+# NOTE: Keyed by (url, trust_url), as trust_url changes redirect
+# handling and thereby the discovered signposting
+_signposting_cache: Dict[Tuple[str, bool], _CacheEntry] = {}
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+
+_ACCEPT_HEADER = {
+    "Accept": "application/linkset+json, text/html;q=0.5, */*;q=0.1"}
+"""Advertise linkset understanding in the header requests.
+
+Signposting-aware servers may then include a ``rel=linkset`` Link
+directly, so a client can follow it with a single further ``GET``
+instead of also having to inspect the HTML landing page."""
+
+_WARN_REGISTRY: Dict = {}
 
+def _warn(message: str):
+    """Emit a UserWarning without walking the caller's stack.
 
-class _HTTPErrorHandler(urllib.request.HTTPDefaultErrorHandler):
-    """A HTTP error handler that permits 410 Gone"""
+    :meth:`warnings.warn` inspects frames to attribute the warning;
+    in batch resolves over thousands of PIDs that adds up.
+    :meth:`warnings.warn_explicit` with a fixed location skips that,
+    and the shared registry still deduplicates repeated messages
+    (per URL, as the URL is part of the message) under the default
+    warning filters.
+    """
+    warnings.warn_explicit(message, UserWarning, __file__, 0,
+                           module=__name__, registry=_WARN_REGISTRY)
+
+
+def _freshness(headers) -> float:
+    """Deadline until which a response may be reused without revalidation.
+
+    Only ``Cache-Control: max-age`` is honoured; responses marked
+    ``no-store``/``no-cache`` (or without max-age) get a zero deadline,
+    so they are only reused after a ``304 Not Modified`` revalidation.
+    """
+    cache_control = headers.get("Cache-Control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return time.monotonic() + int(match.group(1))
+    return 0.0
 
-    def http_error_410(self, req, fp, code, msg, headers):
-        return fp
 
+def _response_for_headers(url: str, session: Optional[requests.Session] = None,
+                          headers: Optional[Dict[str, str]] = None,
+                          use_get: bool = False,
+                          allow_redirects: bool = True) -> requests.Response:
+    """Request `url` for inspecting its response headers.
 
-_http_opener = urllib.request.build_opener(_HTTPErrorHandler)
-# urllib.request.install_opener(opener)
+    A ``HEAD`` request is attempted first, as signposting lives entirely
+    in the headers. Some servers do not implement ``HEAD`` (405 Method
+    Not Allowed or 501 Not Implemented) -- for those a regular ``GET``
+    is retried, which body remains unread and is discarded on close.
+
+    The shared pooled session (see :meth:`sessions.default_session`)
+    keeps connections alive, so repeated resolves against the same host
+    skip the TCP/TLS handshakes.
+
+    Failures are raised as the :mod:`urllib.error` exceptions this
+    module has always thrown, so existing callers need not catch the
+    :mod:`requests` equivalents.
+
+    :param headers: Optional extra request headers,
+        e.g. ``If-None-Match`` for conditional requests.
+    :param use_get: If true, go straight to the streamed ``GET``,
+        e.g. for servers known to omit ``Link`` headers on ``HEAD``.
+    :param allow_redirects: If false, return the first response as-is
+        instead of following any redirects.
+    :throws urllib.error.HTTPError: If the HTTP request failed, e.g. 404 Not Found.
+        As before, ``410 Gone`` is permitted.
+    :throws urllib.error.URLError: If the network request failed,
+        e.g. connection refused.
+    """
+    s = session or default_session()
+    if headers:
+        headers = {**_ACCEPT_HEADER, **headers}
+    else:
+        headers = _ACCEPT_HEADER
+    try:
+        if not use_get:
+            res = s.head(url, allow_redirects=allow_redirects, timeout=TIMEOUT,
+                         headers=headers)
+        if use_get or res.status_code == 405 or res.status_code == 501:
+            res = s.get(url, allow_redirects=allow_redirects, timeout=TIMEOUT,
+                        headers=headers, stream=True)
+            res.close()  # Only the headers are of interest
+    except requests.exceptions.RequestException as e:
+        raise urllib.error.URLError(e)
+    if res.status_code >= 400 and res.status_code != 410:
+        raise urllib.error.HTTPError(res.url, res.status_code,
+                                     res.reason or "",
+                                     res.headers,  # type: ignore[arg-type]
+                                     None)
+    return res
 
 
-def find_signposting_http(url: str, warn_empty:bool=True) -> Signposting:
+def find_signposting_http(url: str, warn_empty:bool=True,
+                          session:Optional[requests.Session]=None,
+                          trust_url:bool=False) -> Signposting:
     """Find signposting from HTTP headers.
 
     :param url: The URL to request HTTP ``Link`` headers from using HTTP ``HEAD``
+        (or ``GET``, if the server does not support ``HEAD``)
     :param warn_empty: If true, raise warning if no direct signpostings were found
+    :param session: Optional :class:`requests.Session` to reuse connections from
+    :param trust_url: If true, treat `url` as already canonical: redirects
+        are not followed (saving the extra round-trips for PIDs the caller
+        has already resolved) and `url` itself becomes the context of the
+        returned signposting.
     :return: A parsed :class:`Signposting` object of the discovered signposting
     """
-    req = urllib.request.Request(url, method="HEAD")
-    link_headers: List[str] = []  # Fall-back: No links
-    with _http_opener.open(req) as res:
-        if (res.getcode() == 203):
-            warnings.warn("203 Non-Authoritative Information <%s> - Signposting URIs may have been rewritten by proxy" %
-                          res.geturl())
-        elif (res.getcode() == 410):
-            warnings.warn(
-                "410 Gone <%s> - still processing signposting for thumbstone page" % res.geturl())
-            # Note: Other 4xx error codes would throw exceptions by _HTTPErrorHandler defaults
-        link_headers = res.headers.get_all("Link") or []
-
-    signposting = linkheader.find_signposting_http_link(link_headers, res.geturl())
+    cache_key = (url, trust_url)
+    entry = _signposting_cache.get(cache_key)
+    conditional: Optional[Dict[str, str]] = None
+    if entry is not None:
+        if time.monotonic() < entry.expires_at:
+            # Still fresh per Cache-Control; skip the network entirely
+            if warn_empty and not entry.signposting:
+                _warn("No direct signposting found in HTTP links from <%s>" %
+                      (entry.signposting.context or url))
+            return entry.signposting
+        conditional = {}
+        if entry.etag:
+            conditional["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            conditional["If-Modified-Since"] = entry.last_modified
+        if not conditional:
+            conditional = None
+
+    res = _response_for_headers(url, session, conditional,
+                                allow_redirects=not trust_url)
+    if entry is not None and res.status_code == 304:
+        # Not Modified: reuse the parsed Signposting, renewing freshness
+        _signposting_cache[cache_key] = entry._replace(
+            expires_at=_freshness(res.headers))
+        if warn_empty and not entry.signposting:
+            _warn("No direct signposting found in HTTP links from <%s>" %
+                  (entry.signposting.context or url))
+        return entry.signposting
+    if res.status_code == 203 and not trust_url:
+        _warn("203 Non-Authoritative Information <%s> - Signposting URIs may have been rewritten by proxy" %
+              res.url)
+    elif res.status_code == 410:
+        _warn(
+            "410 Gone <%s> - still processing signposting for thumbstone page" % res.url)
+        # Note: Other 4xx error codes have been raised by _response_for_headers
+    # NOTE: requests combines repeated Link headers comma-separated,
+    # which find_signposting_http_link re-joins the same way anyway
+    link_header = res.headers.get("Link")
+    if link_header is None and res.request.method == "HEAD":
+        # RFC7231 only *recommends* identical headers on HEAD and GET;
+        # some servers omit Link on HEAD. Retry with a GET that is
+        # closed after the headers, before concluding there are none.
+        res = _response_for_headers(url, session, use_get=True,
+                                    allow_redirects=not trust_url)
+        link_header = res.headers.get("Link")
+
+    # A trusted URL is taken as canonical, skipping redirect resolution
+    base_url = url if trust_url else res.url
+    signposting = find_signposting_from_headers(link_header or [], base_url, warn_empty)
+
+    etag = res.headers.get("ETag")
+    last_modified = res.headers.get("Last-Modified")
+    expires_at = _freshness(res.headers)
+    if etag or last_modified or expires_at:
+        # Only worth caching if it can be reused or revalidated
+        if len(_signposting_cache) >= _CACHE_SIZE:
+            # Evict the oldest insertion (dicts preserve order)
+            del _signposting_cache[next(iter(_signposting_cache))]
+        _signposting_cache[cache_key] = _CacheEntry(
+            etag, last_modified, expires_at, signposting)
+    return signposting
+
+
+def find_signposting_from_headers(link_headers: Union[str, List[str]], base_url: str,
+                                  warn_empty: bool = False) -> Signposting:
+    """Find signposting in already retrieved HTTP ``Link`` headers.
+
+    This is the zero-network shortcut for callers that have a response
+    in hand (e.g. a crawler that just fetched ``base_url``), instead of
+    having :meth:`find_signposting_http` repeat the request.
+
+    :param link_headers: The ``Link`` header values of the response
+        (without the ``"Link:"`` prefix), as a list or a single
+        (possibly comma-combined) string; an empty list if there were none.
+    :param base_url: The (redirect-resolved) URL the headers came from,
+        used as context and to absolutize relative link targets.
+    :param warn_empty: If true, raise warning if no direct signpostings were found
+    :return: A parsed :class:`Signposting` object of the discovered signposting
+    :raise ValueError: If link headers that may contain signposting
+        could not be parsed. Headers without any signposting-looking
+        relations are skipped without syntax checking.
+    """
+    signposting = linkheader.find_signposting_http_link(link_headers, base_url)
     if warn_empty and not signposting:
-        warnings.warn("No direct signposting found in HTTP links from <%s>" % res.geturl())
+        _warn("No direct signposting found in HTTP links from <%s>" % base_url)
     return signposting
+
+
+def find_signposting_http_many(urls: Iterable[str], max_workers: int = 16,
+                               warn_empty: bool = True,
+                               session: Optional[requests.Session] = None) -> List[Signposting]:
+    """Find signposting from HTTP headers of multiple URLs concurrently.
+
+    The requests are overlapped in a thread pool -- as the resolves are
+    I/O bound, this scales almost linearly up to ``max_workers`` without
+    needing asyncio. All threads share one pooled session (see
+    :meth:`sessions.default_session`), so resolves against the same
+    host also reuse its connections.
+
+    The returned list matches the order of `urls`, regardless of which
+    request completed first. A failed resolve raises from this method as
+    from :meth:`find_signposting_http`; remaining requests are not
+    cancelled, but their results are discarded.
+
+    :param urls: The URLs to request HTTP ``Link`` headers from
+    :param max_workers: Maximum number of concurrent requests
+    :param warn_empty: If true, raise warning per URL without direct signposting
+    :param session: Optional :class:`requests.Session` to reuse connections from
+    :return: Parsed :class:`Signposting` objects, in the order of `urls`
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda url: find_signposting_http(url, warn_empty, session), urls))
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2022 The University of Manchester, UK
+#
+#   Copyright 2022 The University of Manchester, UK
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""
+Shared pooled HTTP sessions used by the ``find_signposting_*`` methods.
+
+This module deliberately has no parser dependencies, so that e.g.
+:mod:`resolver` can use the session pool without importing bs4.
+"""
+
+import ssl
+from typing import Optional
+
+import certifi
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from . import __version__
+
+TIMEOUT = (5, 30)
+"""Default connect/read timeouts (in seconds) of HTTP requests"""
+
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+"""Shared TLS context of the pooled sessions.
+
+urllib3 otherwise builds a fresh ``SSLContext`` per connection, which
+cannot resume earlier TLS sessions. One shared context retains the
+server's session tickets, so new connections to a recently seen host
+handshake in a single round-trip. Verification follows the same
+:mod:`certifi` bundle that :mod:`requests` uses by default."""
+_SSL_CONTEXT.options &= ~ssl.OP_NO_TICKET
+
+USER_AGENT = "signposting-py/%s (+https://github.com/stain/signposting)" % __version__
+"""``User-Agent`` header sent by the pooled sessions.
+
+Some servers return degraded headers (or none at all) to the generic
+``python-requests`` agent, so identify this library instead."""
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools share :data:`_SSL_CONTEXT`"""
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = _SSL_CONTEXT
+        super().init_poolmanager(*args, **kwargs)
+
+def new_session(session:Optional[requests.Session]=None) -> requests.Session:
+    """Create a HTTP session with connection pooling and retries.
+
+    The session reuses TCP/TLS connections across requests to the
+    same host, and retries transient 502/503/504 server errors.
+
+    :param session: Optional existing session (e.g. a
+        ``requests_cache.CachedSession``) to mount the pooled adapters on,
+        instead of creating a plain :class:`requests.Session`.
+    """
+    if session is None:
+        session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = _PooledAdapter(pool_connections=32, pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=(502, 503, 504)))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_SESSION: Optional[requests.Session] = None
+
+def default_session() -> requests.Session:
+    """The shared session used when no ``session`` argument was provided.
+
+    Created on first use; replaceable with :meth:`set_session`.
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = new_session()
+    return _SESSION
+
+def set_session(session:requests.Session):
+    """Replace the shared default session, e.g. with a caching session.
+
+    This affects subsequent ``find_signposting_*`` calls that do not
+    provide their own ``session`` argument.
+    """
+    global _SESSION
+    _SESSION = session
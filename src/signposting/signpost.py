@@ -37,9 +37,11 @@ about type safety.
 # PEP-563 support self-references of types in class definitions
 from __future__ import annotations
 
+import functools
 import itertools
 import re
-from typing import Iterable, Iterator, Optional, Dict, Set, Sized, Union, AbstractSet, FrozenSet
+import sys
+from typing import Iterable, Iterator, Optional, Dict, Set, Sized, Tuple, Union, AbstractSet, FrozenSet
 from enum import Enum, unique
 from warnings import warn
 
@@ -49,6 +51,29 @@ from httplink import Link
 
 class AbsoluteURI(str):
     """An absolute URI, e.g. "http://example.com/" """
+
+    _FAST_URI_RE = re.compile(r"""^
+        [A-Za-z][A-Za-z0-9+.-]*     # scheme
+        :
+        (?: [A-Za-z0-9\-._~:/?@!$&'()*+,;=]  # RFC3986 allowed characters
+          | %[0-9A-Fa-f]{2}                  # complete %-escape
+        )+
+        (?: \#                               # at most one fragment
+            (?: [A-Za-z0-9\-._~:/?@!$&'()*+,;=]
+              | %[0-9A-Fa-f]{2}
+            )*
+        )?
+        $""", re.VERBOSE)
+    """Fast-path check for absolute URIs of unreserved/reserved characters.
+
+    URIs accepted by this regex are valid absolute URIs, skipping the
+    (comparatively slow) grammar of :meth:`rfc3987.parse`. URIs *not*
+    matching here may still be valid and get the full grammar treatment --
+    notably ``[``/``]`` (only legal around IPv6 literals) and ``%`` other
+    than as a complete escape, so this accepts a strict subset of the
+    full grammar. ``#`` may occur at most once, starting the fragment.
+    """
+
     def __new__(cls, value: str, base: Optional[str] = None):
         """Create and validate an absolute URI reference.
 
@@ -60,11 +85,7 @@ class AbsoluteURI(str):
         """
         if isinstance(value, cls):
             return value # Already AbsoluteURI, no need to check again
-        # Resolve potentially relative URI reference when base is given
-        uri = urljoin(base or "", value)
-        # will throw ValueError if resolved URI is not valid
-        rfc3987.parse(uri, rule="URI")
-        return super(AbsoluteURI, cls).__new__(cls, uri)
+        return super(AbsoluteURI, cls).__new__(cls, _resolved_uri(value, base))
 
     # @staticmethod
     # def from_iri(cls, value: str, base: Optional[str] = None):
@@ -78,6 +99,29 @@ class AbsoluteURI(str):
     #   return ...
 
 
+@functools.lru_cache(maxsize=4096)
+def _resolved_uri(value: str, base: Optional[str]) -> str:
+    """Resolve and validate an absolute URI string, memoized.
+
+    In a signposting document the same context/base and target strings
+    repeat across many signposts, so the urljoin and grammar check for a
+    given pair only need to run once. Invalid input raises ValueError as
+    before -- :meth:`functools.lru_cache` does not cache exceptions.
+    """
+    if base:
+        # Resolve potentially relative URI reference
+        uri = urljoin(base, value)
+    else:
+        # urljoin("", value) returns value unchanged, skip the
+        # urlparse/urlunparse round-trip; validation below still
+        # rejects relative references
+        uri = value
+    if not AbsoluteURI._FAST_URI_RE.match(uri):
+        # will throw ValueError if resolved URI is not valid
+        rfc3987.parse(uri, rule="URI")
+    return uri
+
+
 class MediaType(str):
     """An IANA media type, e.g. ``text/plain``.
 
@@ -96,7 +140,8 @@ class MediaType(str):
     .. _RFC6838: https://www.rfc-editor.org/rfc/rfc6838.html
     """
 
-    MAIN = "application audio example font image message model multipart text video".split()
+    MAIN = frozenset(
+        "application audio example font image message model multipart text video".split())
     """Top level type trees as of 2022-05-17 in `IANA`_ registry
 
     .. _IANA: https://www.iana.org/assignments/media-types/media-types.xhtml"""
@@ -106,7 +151,7 @@ class MediaType(str):
         ([a-z0-9] [a-z0-9!#$&^_-]*)
         /
         ([a-z0-9] [a-z0-9!#$&^_+.-]*)
-        $""", re.VERBOSE)
+        $""", re.VERBOSE | re.ASCII)
     """Check the type string is valid following `section 4.2`_ of RFC6838.
 
      .. _section 4.2: https://www.rfc-editor.org/rfc/rfc6838.html#section-4.2
@@ -127,26 +172,51 @@ class MediaType(str):
             # Guard before giving large media type to regex
             raise ValueError(
                 "Media type should be less than 255 characters long")
-        match = cls._MAIN_SUB_RE.match(value.lower())
-        if not match:
-            raise ValueError(
-                "Media type invalid according to RFC6838: {}".format(value))
-        main, sub = match.groups()
-        if len(main) > 127:
-            raise ValueError(
-                "Media main type should be no more than 127 characters long")
-        if len(sub) > 127:
-            raise ValueError(
-                "Media sub-type should be no more than 127 characters long")
+        media_type, main, sub = _media_main_sub(value)
         if not main in cls.MAIN:
             warn("Unrecognized media type main tree: {}".format(main))
         # Ensure we use the matched string
-        t = super(MediaType, cls).__new__(cls, match.group())
+        t = super(MediaType, cls).__new__(cls, media_type)
         t.main = main
         t.sub = sub
         return t
 
 
+@functools.lru_cache(maxsize=256)
+def _media_main_sub(value: str) -> Tuple[str, str, str]:
+    """Validate a media type string, memoized.
+
+    The same handful of media types repeat across signposts, so the
+    lowercasing and regex match for a given string only run once.
+
+    :return: Tuple of the canonical (lower case) media type string
+        and its main and sub type.
+    :raise ValueError: if the media type is invalid per RFC6838
+        (not cached).
+    """
+    slash = value.find("/")
+    if slash <= 0 or slash == len(value) - 1:
+        # Obvious reject, e.g. missing or trailing "/" -- skip the regex
+        raise ValueError(
+            "Media type invalid according to RFC6838: {}".format(value))
+    # Usually already lower case; only then allocate a lowered copy
+    match = MediaType._MAIN_SUB_RE.match(
+        value if value.islower() else value.lower())
+    if not match:
+        raise ValueError(
+            "Media type invalid according to RFC6838: {}".format(value))
+    main, sub = match.groups()
+    if len(main) > 127:
+        raise ValueError(
+            "Media main type should be no more than 127 characters long")
+    if len(sub) > 127:
+        raise ValueError(
+            "Media sub-type should be no more than 127 characters long")
+    # Media types are a small vocabulary repeated across signposts;
+    # interned strings hash and compare by identity
+    return sys.intern(match.group()), sys.intern(main), sys.intern(sub)
+
+
 @unique
 class LinkRel(str, Enum):
     """A link relation as used in Signposting.
@@ -181,8 +251,17 @@ class LinkRel(str, Enum):
         return self.value
 
 
-"""Signposting link relations as strings"""
-SIGNPOSTING = set(l.value for l in LinkRel)
+"""Signposting link relations as strings.
+
+The values are interned so that membership tests against parsed
+(and equally interned) ``rel`` tokens short-circuit on identity."""
+SIGNPOSTING = frozenset(sys.intern(l.value) for l in LinkRel)
+
+_REL_BY_STR = {l.value: l for l in LinkRel}
+"""Lookup of enum member by RFC8288 value, bypassing Enum.__call__"""
+
+_EMPTY_PROFILES: FrozenSet[AbsoluteURI] = frozenset()
+"""Shared empty :attr:`Signpost.profiles` for the common profile-less case"""
 
 class Signpost:
     """An individual link of Signposting, e.g. for ``rel=cite-as``.
@@ -195,6 +274,11 @@ class Signpost:
     lift only the navigational attributes for FAIR Signposting.
     """
 
+    __slots__ = ("rel", "target", "type", "profiles", "context", "link",
+                 "_key")
+    # NOTE: No per-instance __dict__; crawls over large linksets hold
+    # thousands of signposts at a time
+
     rel: Union[LinkRel,AbsoluteURI]
     """The link relation of this signposting"""
 
@@ -246,13 +330,16 @@ class Signpost:
     possible that multiple :class:`Signpost` instances refer to the same link.
     """
 
+    _key: Tuple[object, ...]
+    """Cached equality tuple, see :meth:`_eq_key`. Assigned on first use."""
+
     def __init__(self,
                  rel: Union[LinkRel, AbsoluteURI, str],
                  target: Union[AbsoluteURI, str],
-                 media_type: Union[MediaType, str] = None,
-                 profiles: Union[AbstractSet[AbsoluteURI], str] = None,
-                 context: Union[AbsoluteURI, str] = None,
-                 link: Link = None):
+                 media_type: Optional[Union[MediaType, str]] = None,
+                 profiles: Optional[Union[AbstractSet[AbsoluteURI], str]] = None,
+                 context: Optional[Union[AbsoluteURI, str]] = None,
+                 link: Optional[Link] = None):
         """Construct a Signpost from a link relation.
 
         :param rel: Link relation, e.g. ``"cite-as"``
@@ -277,7 +364,9 @@ class Signpost:
         elif ":" in rel:
             self.rel = AbsoluteURI(rel) # May throw ValueError
         else:
-            self.rel = LinkRel(rel)  # May throw ValueError
+            # Dict hit instead of the slower Enum.__call__;
+            # fall back for the ValueError of unknown relations
+            self.rel = _REL_BY_STR.get(rel) or LinkRel(rel)
 
 
         if isinstance(target, AbsoluteURI):
@@ -297,10 +386,14 @@ class Signpost:
                 assert isinstance(p, AbsoluteURI)
             self.profiles = frozenset(profiles)
         elif profiles:
-            self.profiles = frozenset(AbsoluteURI(p, base=self.context)
-                                      for p in profiles.split(" "))
+            if " " not in profiles:
+                # Single profile, no need to split
+                self.profiles = frozenset((AbsoluteURI(profiles, base=self.context),))
+            else:
+                self.profiles = frozenset(AbsoluteURI(p, base=self.context)
+                                          for p in profiles.split(" "))
         else:
-            self.profiles = frozenset()
+            self.profiles = _EMPTY_PROFILES
 
 
         self.link = link
@@ -333,9 +426,9 @@ class Signpost:
     def _eq_attribs(self) -> Iterable[object]:
         """Attributes of the Signpost important for equality testing,
         returned in a predictable (but undefined) order.
-        
+
         This method is used by __eq__ and __hash__ internally.
-        
+
         Subclasses are encouraged to overwrite and add additional attributes
         in a consistent order at the end."""
         # NOTE: context **is** included in equality so that multiple Signpost
@@ -349,24 +442,29 @@ class Signpost:
         # As self.profiles is a frozenset it is eligible for hash()
         yield self.profiles
 
+    def _eq_key(self) -> tuple:
+        """Tuple of :meth:`_eq_attribs`, computed once per instance.
+
+        All attributes that take part in equality are immutable, so the
+        key (and thereby our hash) is cached after first use --
+        signposts are frequently deduplicated through sets when
+        Signposting instances are constructed or merged.
+        """
+        try:
+            return self._key
+        except AttributeError:
+            key = tuple(self._eq_attribs())
+            self._key = key
+            return key
+
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, Signpost):
             return False
         # Assume _eq_attribs has consistent ordering.
-        for a,b in zip(self._eq_attribs(), o._eq_attribs()):
-            if a != b:
-                return False
-        return True
-    
+        return self._eq_key() == o._eq_key()
+
     def __hash__(self) -> int:
-        h = hash(self.__class__.__qualname__)
-        for e in self._eq_attribs():
-            # Classic XOR would mean order does not matter, but
-            # links may have URIs swapped around. As that is unlikely
-            # for real-life signposts, we don't need to include 
-            # a positional hashing like in hash(tuple)
-            h ^= hash(e)
-        return h
+        return hash(self._eq_key())
 
     def with_context(self, context: Union[AbsoluteURI, str, None]) -> Signpost:
         """Create a copy of this signpost, but with the specified context.
@@ -391,6 +489,11 @@ class Signposting(Iterable[Signpost], Sized):
     .. _FAIR: https://signposting.org/FAIR/
     """
 
+    __slots__ = ("context", "other_contexts", "authors", "describedBy",
+                 "describes", "types", "items", "linksets", "citeAs",
+                 "license", "collection", "_extras", "_others", "_extensions",
+                 "_len", "_signposts", "_hash")
+
     context: Optional[AbsoluteURI]
     """Resource URI this is the signposting for, e.g. a HTML landing page.
     
@@ -464,10 +567,40 @@ class Signposting(Iterable[Signpost], Sized):
     _extensions: Dict[AbsoluteURI,Set[Signpost]]
     """Map of signpost for extensions"""
 
+    _len: int
+    """Number of signposts of our context, see :meth:`__len__`"""
+
+    _signposts: FrozenSet[Signpost]
+    """Cache of :attr:`signposts`. Assigned on first access."""
+
+    _hash: int
+    """Cache of :meth:`__hash__`. Assigned on first use."""
 
-    def __init__(self, 
-                 context: Union[AbsoluteURI, str] = None, 
-                 signposts: Iterable[Signpost] = None,
+    # Union includes AbsoluteURI so Signpost.rel can be looked up directly
+    _SET_RELS: Dict[Union[LinkRel, AbsoluteURI], str] = {
+        LinkRel.author: "authors",
+        LinkRel.describedby: "describedBy",
+        LinkRel.describes: "describes",
+        LinkRel.item: "items",
+        LinkRel.linkset: "linksets",
+        LinkRel.type: "types",
+    }
+    """Dispatch from link relation to corresponding set attribute.
+
+    A dict lookup instead of an if/elif chain per signpost; linksets may
+    list thousands of ``item`` relations."""
+
+    _SINGULAR_RELS: Dict[Union[LinkRel, AbsoluteURI], str] = {
+        LinkRel.cite_as: "citeAs",
+        LinkRel.license: "license",
+        LinkRel.collection: "collection",
+    }
+    """Dispatch from link relation to singular attribute, as :attr:`_SET_RELS`"""
+
+
+    def __init__(self,
+                 context: Optional[Union[AbsoluteURI, str]] = None,
+                 signposts: Optional[Iterable[Signpost]] = None,
                  include_no_context: bool = True,
                  warn_duplicate=True):
         """The constructor takes a an iterable of :class:`Signpost`.
@@ -519,6 +652,7 @@ class Signposting(Iterable[Signpost], Sized):
         self._extensions = {}
 
         if signposts is None:
+            self._len = 0
             return # We're empty
         # Populate above attributes from list of signposts
         for s in signposts:
@@ -533,43 +667,70 @@ class Signposting(Iterable[Signpost], Sized):
                 self._others.add(s)
                 if context:
                     self.other_contexts.add(context)
-            elif s.rel is LinkRel.cite_as:
-                if self.citeAs and self.citeAs.target != s.target:
-                    warn("Ignoring additional cite-as signposts") if warn_duplicate else None
-                    self._extras.add(s)
-                else:
-                    self.citeAs = s
-            elif s.rel is LinkRel.license:
-                if self.license and self.license.target != s.target:
-                    warn("Ignoring additional license signposts") if warn_duplicate else None
-                    self._extras.add(s)
-                else:
-                    self.license = s
-            elif s.rel is LinkRel.collection:
-                if self.collection and self.collection.target != s.target:
-                    warn("Ignoring additional collection signposts") if warn_duplicate else None
+                continue
+            attr = self._SET_RELS.get(s.rel)
+            if attr is not None:
+                getattr(self, attr).add(s)
+                continue
+            attr = self._SINGULAR_RELS.get(s.rel)
+            if attr is not None:
+                existing = getattr(self, attr)
+                if existing and existing.target != s.target:
+                    if warn_duplicate:
+                        warn("Ignoring additional %s signposts" % s.rel)
                     self._extras.add(s)
                 else:
-                    self.collection = s
-            elif s.rel is LinkRel.author:
-                self.authors.add(s)
-            elif s.rel is LinkRel.describedby:
-                self.describedBy.add(s)
-            elif s.rel is LinkRel.describes:
-                self.describes.add(s)
-            elif s.rel is LinkRel.item:
-                self.items.add(s)
-            elif s.rel is LinkRel.linkset:
-                self.linksets.add(s)
-            elif s.rel is LinkRel.type:
-                self.types.add(s)
-            elif isinstance(s.rel, AbsoluteURI): 
+                    setattr(self, attr, s)
+            elif isinstance(s.rel, AbsoluteURI):
                 self._extras.add(s)
                 self._extensions.setdefault(s.rel, set()).add(s)
             else:
                 warn("Unrecognized link relation: %s" % s.rel)
                 # NOTE: This means a new enum member in LinkRel that we should handle above
                 self._extras.add(s)
+        # Count the signposts of our context once; instances are not
+        # mutated after construction, so __len__ (and thereby bool())
+        # need not re-iterate per call
+        self._len = ((self.citeAs is not None) + (self.license is not None)
+                     + (self.collection is not None)
+                     + len(self.authors) + len(self.describedBy)
+                     + len(self.describes) + len(self.items)
+                     + len(self.linksets) + len(self.types)
+                     + len(self._extras))
+
+    @classmethod
+    def merge(cls, signpostings: Iterable[Signposting]) -> Signposting:
+        """Merge any number of Signposting instances in a single pass.
+
+        This is equivalent to chaining :meth:`__or__` over `signpostings`,
+        but collects all the underlying signposts up front so that only
+        one merged `Signposting` is constructed, instead of one
+        intermediary copy per instance merged.
+
+        The context of the merged Signposting is taken from the first
+        instance that has an explicit context, if any. As in :meth:`__or__`,
+        implicit contexts are made explicit while merging so that
+        signposts from different contexts do not get conflated.
+
+        :param signpostings: An iterable of `Signposting` instances to merge
+        :return: A new `Signposting` instance of the merged signposts,
+            which may be empty if `signpostings` was empty.
+        """
+        context: Optional[AbsoluteURI] = None
+        # Dedupe preserving encounter order, so that for conflicting
+        # singular rels (e.g. cite-as) the constructor's first-wins
+        # logic deterministically keeps the earliest signpost, as
+        # chaining __or__ would
+        merged: Dict[Signpost, None] = {}
+        for signposting in signpostings:
+            if context is None:
+                context = signposting.context
+            # NOTE: If signposting.context is None this yields signposts as-is
+            merged.update(dict.fromkeys(
+                signposting._signposts_with_explicit_context()))
+        return cls(context, merged,
+                   include_no_context=context is None,
+                   warn_duplicate=False)
 
     @property
     def signposts(self) -> AbstractSet[Signpost]:
@@ -579,7 +740,14 @@ class Signposting(Iterable[Signpost], Sized):
         that only expect a single link, like :attr:`citeAs`, as well
         as any signposts for other contexts as listed in :attr:`other_contexts`.
         """
-        return frozenset(itertools.chain(self, self._others))
+        # As with _len, instances are immutable after construction, so
+        # build the frozenset only on first access
+        try:
+            return self._signposts
+        except AttributeError:
+            signposts = frozenset(itertools.chain(self, self._others))
+            self._signposts = signposts
+            return signposts
 
     def _signposts_with_explicit_context(self) -> Iterable[Signpost]:
         """Iterate over all our signposts, making context explicit if possible.
@@ -634,10 +802,7 @@ class Signposting(Iterable[Signpost], Sized):
 
     def __len__(self) -> int:
         """Count how many FAIR Signposts were recognized for the given context"""
-        # Note: tuple(self) fails here, as tuple will call our __len__ to pre-allocate
-        #return len(tuple(self))
-        # Instead we'll do it with a nice generator
-        return sum(1 for _ in self)
+        return self._len
     
     def __iter__(self) -> Iterator[Signpost]:
         """Iterate over all FAIR signposts recognized for the given context.
@@ -650,20 +815,15 @@ class Signposting(Iterable[Signpost], Sized):
             yield self.license
         if self.collection:
             yield self.collection
-        for a in self.authors:
-            yield a
-        for d in self.describedBy:
-            yield d
-        for ds in self.describes:
-            yield ds
-        for i in self.items:
-            yield i
-        for l in self.linksets:
-            yield l
-        for t in self.types:
-            yield t
-        for e in self._extras:
-            yield e
+        # yield from delegates set iteration without resuming our
+        # generator frame per signpost
+        yield from self.authors
+        yield from self.describedBy
+        yield from self.describes
+        yield from self.items
+        yield from self.linksets
+        yield from self.types
+        yield from self._extras
         # NOTE: self._others are NOT included as they have a different context
 
     def __eq__(self, o) -> bool:
@@ -681,6 +841,10 @@ class Signposting(Iterable[Signpost], Sized):
         """
         if not isinstance(o, Signposting):
             return False
+        if self is o:
+            return True
+        if self._len != o._len:
+            return False  # Counts are precomputed, sets need not be built
         return set(self) == set(o)
 
     def __hash__(self) -> int:
@@ -689,16 +853,17 @@ class Signposting(Iterable[Signpost], Sized):
         The result of this hash method is consistent with :meth:`__eq__` in that
         only each signpost of the current context are part of the calculation.
         """
-        h = hash(self.__class__.__qualname__)
         # NOTE context is NOT included in equality checks, see __eq__
-        ## h ^= hash(self.context)
-        for e in self:
-            # We use a naive XOR here as order should NOT matter
-            h ^= hash(e)
-        # Signposts in other contexts are ignored
-        ##for e in self._others:
-        ##    h ^= hash(e)
-        return h
+        # Signposts in other contexts are likewise ignored.
+        # frozenset hashing combines the element hashes in C,
+        # order-independently; as the instance is immutable the result
+        # is computed only once
+        try:
+            return self._hash
+        except AttributeError:
+            h = hash((self.__class__.__qualname__, frozenset(self)))
+            self._hash = h
+            return h
 
     def _repr_signposts(self, signposts) -> str:
         """String representation of a list of signposts"""
@@ -0,0 +1,8 @@
+# Minimal stub for the optional requests-cache dependency
+
+from typing import Any
+
+import requests
+
+class CachedSession(requests.Session):
+    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
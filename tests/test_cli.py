@@ -18,6 +18,9 @@
 
 import unittest
 import os
+
+import requests_mock
+
 from signposting import cli
 import sys
 import warnings
@@ -36,6 +39,29 @@ class TestCommandLineToolParsing(unittest.TestCase):
         finally:
             sys.argv = argv
 
+
+class TestCommandLineToolWorkers(unittest.TestCase):
+    """Concurrent discovery of multiple URLs with --workers."""
+
+    def test_many_urls_limited_workers(self):
+        with requests_mock.Mocker() as m:
+            URLS = ["https://cli.example.net/%d/" % i for i in range(4)]
+            for url in URLS:
+                m.head(url, headers={"Link": "<%spid>;rel=cite-as" % url})
+            exit = cli.main("--http", "--workers", "2", *URLS)
+            self.assertEqual(cli.ERROR.OK, exit)
+            # Each URL was resolved (in some order), none twice
+            requested = [r.url for r in m.request_history]
+            self.assertEqual(sorted(requested), URLS)
+
+    def test_single_worker(self):
+        with requests_mock.Mocker() as m:
+            URL = "https://cli.example.net/single/"
+            m.head(URL, headers={"Link": "<%spid>;rel=cite-as" % URL})
+            exit = cli.main("--http", "-w", "1", URL)
+            self.assertEqual(cli.ERROR.OK, exit)
+
+
 @unittest.skipIf(os.environ.get("CI"), "Integration tests requires network access")
 class TestCommandLineTool(unittest.TestCase):
     def test_00_404(self):
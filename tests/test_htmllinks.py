@@ -271,6 +271,25 @@ class TestParseHTML(unittest.TestCase):
         self.assertEqual("https://example.com/TODO-ignore-links-in-body/index.html", signposts.context)
         self.assertEqual(0, len(signposts))
 
+    def test_parse_html_ignore_links_in_comment(self):
+        html = htmllinks.HTML('<html><head><!-- <link rel="cite-as" href="https://example.com/not-a-pid"> -->'
+            '<link rel="cite-as" href="https://example.com/TODO-ignore-links-in-comment/"></head></html>', "text/html",
+            AbsoluteURI("https://example.com/TODO-ignore-links-in-comment/"),
+            AbsoluteURI("https://example.com/TODO-ignore-links-in-comment/index.html"))
+        with warnings.catch_warnings(record=True):
+            signposts = htmllinks._parse_html(html)
+        self.assertEqual(1, len(signposts))
+        self.assertEqual("https://example.com/TODO-ignore-links-in-comment/", signposts.citeAs.target)
+
+    def test_parse_html_ignore_links_in_script(self):
+        html = htmllinks.HTML('<html><head><script>document.write(\'<link rel="cite-as" href="https://example.com/not-a-pid">\')</script>'
+            '</head></html>', "text/html",
+            AbsoluteURI("https://example.com/TODO-ignore-links-in-script/"),
+            AbsoluteURI("https://example.com/TODO-ignore-links-in-script/index.html"))
+        with warnings.catch_warnings(record=True):
+            signposts = htmllinks._parse_html(html)
+        self.assertEqual(0, len(signposts))
+
     def test_parse_html_missing_href(self):
         """A variant of test_parse_html_a2a_18, but HTML inline"""
         html = htmllinks.HTML('<html><head><link rel="describedBy" XXXhref="foo"><link rel="cite-as" href="https://example.com/TODO-ignore-missing-href/"></head></html>', "text/html",
@@ -139,6 +139,18 @@ class TestFindSignposting(unittest.TestCase):
                          "http://example.com/cite-as")
         self.assertIsNone(s.collection)
 
+    def test_find_signposting_single_string(self):
+        # A single comma-combined header string, as RFC8288 permits and
+        # e.g. requests' response.headers["Link"] returns
+        s = linkheader.find_signposting_http_link(
+            ", ".join(self.absolute_headers))
+        self.assertEqual(s, linkheader.find_signposting_http_link(
+            self.absolute_headers))
+        self.assertEqual(s.citeAs.target,
+                         "http://example.com/cite-as")
+        self.assertEqual({a.target for a in s.authors},
+                         {"http://example.com/author1", "http://example.com/author2"})
+
     relative_headers = [
         '<author1>;rel=author',
         '</author2>;rel=author',
@@ -18,13 +18,177 @@
 
 import unittest
 
-from signposting.resolver import find_signposting_http
+import requests_mock
+
+from signposting import resolver
+from signposting.resolver import (find_signposting_from_headers,
+                                  find_signposting_http,
+                                  find_signposting_http_many)
 from signposting.signpost import LinkRel
 import urllib.error
 
 import os
 import warnings
 
+
+class TestFindSignpostingFromHeaders(unittest.TestCase):
+    """Parse already retrieved Link headers, without any network."""
+
+    def test_headers_list(self):
+        s = find_signposting_from_headers(
+            ['<http://example.com/pid/1>;rel=cite-as',
+             '<./index.ttl>;rel=describedby;type="text/turtle"'],
+            "http://example.com/doc/")
+        self.assertEqual("http://example.com/doc/", s.context)
+        self.assertEqual("http://example.com/pid/1", s.citeAs.target)
+        self.assertEqual({d.target for d in s.describedBy},
+                         {"http://example.com/doc/index.ttl"})
+
+    def test_single_string_header(self):
+        # As combined comma-separated by e.g. response.headers["Link"]
+        s = find_signposting_from_headers(
+            '<http://example.com/pid/1>;rel=cite-as, '
+            '<./index.ttl>;rel=describedby',
+            "http://example.com/doc/")
+        self.assertEqual("http://example.com/pid/1", s.citeAs.target)
+        self.assertEqual({d.target for d in s.describedBy},
+                         {"http://example.com/doc/index.ttl"})
+
+    def test_warn_empty(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            s = find_signposting_from_headers(
+                [], "http://example.com/doc/", warn_empty=True)
+            self.assertEqual(len(w), 1)
+            self.assertTrue(issubclass(w[0].category, UserWarning))
+            self.assertIn("No direct signposting", str(w[0].message))
+        self.assertFalse(s)
+
+
+class TestTrustUrl(unittest.TestCase):
+    """trust_url short-circuits redirects and keeps the URL as context."""
+
+    def setUp(self):
+        resolver._signposting_cache.clear()
+
+    def test_trusted_url_is_context(self):
+        with requests_mock.Mocker() as m:
+            PID = "https://pid.example.org/trusted/1"
+            m.head(PID, status_code=302,
+                   headers={"Location": "https://data.example.net/doc/1/",
+                            "Link": "<./index.ttl>;rel=describedby"})
+            s = find_signposting_http(PID, warn_empty=False, trust_url=True)
+            # The redirect was not followed
+            self.assertEqual(len(m.request_history), 1)
+            # .. and relative targets resolve against the trusted URL
+            self.assertEqual(PID, s.context)
+            self.assertEqual({d.target for d in s.describedBy},
+                             {"https://pid.example.org/trusted/index.ttl"})
+
+    def test_untrusted_follows_redirect(self):
+        with requests_mock.Mocker() as m:
+            PID = "https://pid.example.org/untrusted/1"
+            DOC = "https://data.example.net/doc/1/"
+            m.head(PID, status_code=302, headers={"Location": DOC})
+            m.head(DOC, headers={"Link": "<./index.ttl>;rel=describedby"})
+            s = find_signposting_http(PID, warn_empty=False)
+            self.assertEqual(DOC, s.context)
+            self.assertEqual({d.target for d in s.describedBy},
+                             {DOC + "index.ttl"})
+
+
+class TestConditionalCaching(unittest.TestCase):
+    """Repeated resolves should revalidate or reuse cached signposting."""
+
+    def setUp(self):
+        resolver._signposting_cache.clear()
+
+    def test_etag_revalidation(self):
+        with requests_mock.Mocker() as m:
+            URL = "https://cache.example.net/etag/"
+            m.head(URL, [
+                {"headers": {"Link": "<%spid>;rel=cite-as" % URL,
+                             "ETag": '"v1"'}},
+                {"status_code": 304},
+            ])
+            first = find_signposting_http(URL, warn_empty=False)
+            second = find_signposting_http(URL, warn_empty=False)
+            # The 304 Not Modified reused the parsed Signposting
+            self.assertIs(first, second)
+            self.assertEqual(m.request_history[1].headers.get("If-None-Match"),
+                             '"v1"')
+            self.assertEqual(first.citeAs.target, URL + "pid")
+
+    def test_max_age_skips_network(self):
+        with requests_mock.Mocker() as m:
+            URL = "https://cache.example.net/max-age/"
+            m.head(URL, headers={"Link": "<%spid>;rel=cite-as" % URL,
+                                 "Cache-Control": "max-age=60"})
+            first = find_signposting_http(URL, warn_empty=False)
+            second = find_signposting_http(URL, warn_empty=False)
+            # Still fresh; the second resolve made no request at all
+            self.assertEqual(len(m.request_history), 1)
+            self.assertIs(first, second)
+
+    def test_no_validators_not_cached(self):
+        with requests_mock.Mocker() as m:
+            URL = "https://cache.example.net/uncacheable/"
+            m.head(URL, headers={"Link": "<%spid>;rel=cite-as" % URL})
+            find_signposting_http(URL, warn_empty=False)
+            find_signposting_http(URL, warn_empty=False)
+            # Nothing to revalidate or reuse; both resolves hit the server
+            self.assertEqual(len(m.request_history), 2)
+
+
+class TestFindSignpostingHttpMany(unittest.TestCase):
+    """Concurrent resolves return results in argument order."""
+
+    def setUp(self):
+        resolver._signposting_cache.clear()
+
+    def test_many_in_order(self):
+        with requests_mock.Mocker() as m:
+            URLS = ["https://many.example.net/%d/" % i for i in range(5)]
+            for url in URLS:
+                m.head(url, headers={"Link": "<%spid>;rel=cite-as" % url})
+            results = find_signposting_http_many(URLS, warn_empty=False)
+            self.assertEqual([s.citeAs.target for s in results],
+                             [url + "pid" for url in URLS])
+
+    def test_many_limited_workers(self):
+        with requests_mock.Mocker() as m:
+            URLS = ["https://many.example.net/w%d/" % i for i in range(3)]
+            for url in URLS:
+                m.head(url, headers={"Link": "<%spid>;rel=cite-as" % url})
+            results = find_signposting_http_many(URLS, max_workers=1,
+                                                 warn_empty=False)
+            self.assertEqual([s.context for s in results], URLS)
+
+
+class TestGetFallback(unittest.TestCase):
+    """Servers that omit ``Link`` on HEAD should get a GET retry."""
+
+    def test_head_without_link_retries_get(self):
+        with requests_mock.Mocker() as m:
+            URL = "https://head.example.net/get-only-link/"
+            m.head(URL)
+            m.get(URL, headers={"Link": "<%sindex.ttl>;rel=describedby" % URL})
+            s = find_signposting_http(URL, warn_empty=False)
+            # Retried even without warn_empty, which is only a warning flag
+            self.assertEqual([r.method for r in m.request_history],
+                             ["HEAD", "GET"])
+            self.assertEqual({d.target for d in s.describedBy},
+                             {URL + "index.ttl"})
+
+    def test_head_with_link_needs_no_get(self):
+        with requests_mock.Mocker() as m:
+            URL = "https://head.example.net/head-link/"
+            m.head(URL, headers={"Link": "<%sindex.ttl>;rel=describedby" % URL})
+            s = find_signposting_http(URL, warn_empty=False)
+            self.assertEqual([r.method for r in m.request_history], ["HEAD"])
+            self.assertEqual({d.target for d in s.describedBy},
+                             {URL + "index.ttl"})
+
 @unittest.skipIf(os.environ.get("CI"), "Integration tests requires network access")
 class TestResolverA2A(unittest.TestCase):
 
@@ -75,6 +75,17 @@ class TestAbsoluteURI(unittest.TestCase):
         with self.assertRaises(ValueError):
             AbsoluteURI("http: // not valid")
 
+    def testConstructorFragment(self):
+        self.assertEqual("http://example.com/a.txt#section1",
+            AbsoluteURI("http://example.com/a.txt#section1"))
+
+    def testMultipleFragmentsFails(self):
+        # A fragment can't itself contain #
+        with self.assertRaises(ValueError):
+            AbsoluteURI("http://example.com/a#b#c")
+        with self.assertRaises(ValueError):
+            AbsoluteURI("http:###")
+
 
 class TestLinkRel(unittest.TestCase):
     def testEqual(self):
@@ -495,18 +506,12 @@ class TestSignpost(unittest.TestCase):
                 "http://example.org/profileB http://example.org/profileA",
                 "http://example.com/resource/1.html")))
 
-        # We'll knowingly permit hashes to ignore ordering of attributes,
-        # as they are unlikely to overlap in actual signposts. Here we deliberately make two "opposing"
-        # signposts and see if they get the same hash as they'll have swapped
-        # target/context URIs. Implementation of Signpost are allowed
-        # to break this optimization, in which case the below test should be removed.
+        # Hashing is positional since moving to hash() of the attribute
+        # tuple, so two "opposing" signposts with swapped target/context
+        # URIs no longer collide -- and remain unequal.
         s2a = Signpost("cite-as","http://example.com/resource/1.html","text/plain",
                 "http://example.org/profileB http://example.org/profileA",
                 "http://example.com/pid/1")
-        self.assertEqual(hash(s2), hash(s2a))
-        # However these signposts are still unequal,
-        # even if they have same hash. Hashes do not need to be
-        # unique, just unlikely to be so for different objects
         self.assertNotEqual(s2, s2a)
 
     def testWithContext(self):
@@ -1197,6 +1202,47 @@ class TestSignposting(unittest.TestCase):
         self.assertIn("http://example.com/pid/B", {s.target for s in c.signposts})
         self.assertIn("http://example.com/author/2", {s.target for s in c.signposts})
 
+    def testMergeClassmethod(self):
+        a = Signposting("http://example.com/doc1", [
+            Signpost(LinkRel.cite_as, "http://example.com/pid/A"),
+            Signpost(LinkRel.author, "http://example.com/author/1"),
+        ])
+        b = Signposting("http://example.com/doc1", [
+            Signpost(LinkRel.author, "http://example.com/author/2"),
+        ])
+        c = Signposting("http://example.com/doc1", [
+            Signpost(LinkRel.describedby, "http://example.com/metadata1"),
+        ])
+        merged = Signposting.merge([a, b, c])
+        self.assertEqual("http://example.com/doc1", merged.context)
+        self.assertEqual("http://example.com/pid/A", merged.citeAs.target)
+        self.assertEqual({"http://example.com/author/1", "http://example.com/author/2"},
+            {s.target for s in merged.authors})
+        self.assertEqual({"http://example.com/metadata1"},
+            {d.target for d in merged.describedBy})
+        # Equivalent to chaining __or__ over the instances
+        self.assertEqual(a | b | c, merged)
+
+    def testMergeClassmethodConflictingCiteAs(self):
+        a = Signposting("http://example.com/doc1", [
+            Signpost(LinkRel.cite_as, "http://example.com/pid/A"),
+        ])
+        b = Signposting("http://example.com/doc1", [
+            Signpost(LinkRel.cite_as, "http://example.com/pid/B"),
+        ])
+        merged = Signposting.merge([a, b])
+        # The first cite-as deterministically wins, as with a|b
+        self.assertEqual("http://example.com/pid/A", merged.citeAs.target)
+        self.assertEqual((a | b).citeAs.target, merged.citeAs.target)
+        # The loser is still found among all the signposts
+        self.assertIn("http://example.com/pid/B",
+            {s.target for s in merged.signposts})
+
+    def testMergeClassmethodEmpty(self):
+        merged = Signposting.merge([])
+        self.assertIsNone(merged.context)
+        self.assertEqual(0, len(merged))
+        self.assertFalse(merged)
 
     def testAddIterable(self):
         a = Signposting(signposts=[